@@ -33,8 +33,26 @@ def make_FlatTriangulation(vertices, vectors):
     return cppyy.gbl.flatsurf.makeFlatTriangulation(vertices, vectors)
 
 def make_surface(surface_or_vertices, vectors = None):
+    r"""
+    Return a ``FlatTriangulation`` built from a SageMath flatsurf surface, or
+    from a list of vertices and vectors.
+
+    An existing ``FlatTriangulation`` is returned unchanged, i.e., it is not
+    copied.
+
+    EXAMPLES::
+
+        >>> from pyflatsurf import Surface, flatsurf
+        >>> R2 = flatsurf.Vector['long long']
+        >>> square = Surface([[1, 3, 2, -1, -3, -2]], [R2(1, 0), R2(0, 1), R2(1, 1)])
+        >>> Surface(square) is square
+        True
+
+    """
     from collections.abc import Iterable
-    if hasattr(surface_or_vertices, "__module__") and surface_or_vertices.__module__ == "flatsurf.geometry.translation_surface":
+    if vectors is None and getattr(type(surface_or_vertices), "__cpp_name__", "").startswith("flatsurf::FlatTriangulation<"):
+        return surface_or_vertices
+    elif hasattr(surface_or_vertices, "__module__") and surface_or_vertices.__module__ == "flatsurf.geometry.translation_surface":
         if vectors is not None:
             raise ValueError("vectors must be none when creating a FlatTriangulation from a SageMath flatsurf surface")
         from flatsurf.geometry.pyflatsurf_conversion import to_pyflatsurf
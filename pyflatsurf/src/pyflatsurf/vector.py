@@ -31,6 +31,7 @@ from pyeantic import eantic, real_embedded_number_field
 from pyexactreal.exact_reals import ExactReals
 
 from sage.all import ZZ, QQ, FreeModule, FreeModules, Morphism, Hom, SetsWithPartialMaps, NumberFields, Parent, UniqueRepresentation
+from sage.rings.integer import Integer
 from sage.rings.number_field.number_field_base import NumberField as SageNumberField
 from sage.structure.element import Vector as SageVector
 
@@ -87,9 +88,7 @@ class Vector(SageVector):
 
     """
     def __init__(self, parent, vector, y = None):
-        SageVector.__init__(self, parent)
-
-        R = parent.base_ring()
+        self._init_parent(parent, parent.base_ring())
 
         if y is not None:
             vector = (vector, y)
@@ -107,6 +106,51 @@ class Vector(SageVector):
             else:
                 self.vector = parent.Vector(parent._to_coordinate(vector[0]), parent._to_coordinate(vector[1]))
 
+    def _init_parent(self, parent, base_ring):
+        r"""
+        Set up this element as an element of ``parent`` whose base ring is
+        ``base_ring``. This is shared by the constructor and :meth:`_wrap`.
+
+        TESTS::
+
+            sage: from pyflatsurf.vector import Vectors
+            sage: V = Vectors(ZZ)
+            sage: v = V(1, 2)
+            sage: v._P is V and v._R is ZZ
+            True
+
+        """
+        SageVector.__init__(self, parent)
+
+        # Cache the parent and base ring; the arithmetic below would otherwise
+        # look them up again for every operation.
+        self._P = parent
+        self._R = base_ring
+
+    @classmethod
+    def _wrap(cls, parent, base_ring, vector):
+        r"""
+        Return the element of ``parent`` that is backed by ``vector``.
+
+        Unlike the constructor, this does not perform any checks or
+        conversions, i.e., ``vector`` must already be a ``parent.Vector`` and
+        ``base_ring`` must be the base ring of ``parent``.
+
+        EXAMPLES::
+
+            sage: from pyflatsurf import flatsurf
+            sage: from pyflatsurf.vector import Vectors
+            sage: from gmpxxyy import mpz
+            sage: V = Vectors(ZZ)
+            sage: V.element_class._wrap(V, ZZ, flatsurf.Vector[mpz](1, 2))
+            (1, 2)
+
+        """
+        element = cls.__new__(cls)
+        element._init_parent(parent, base_ring)
+        element.vector = vector
+        return element
+
     def _repr_(self):
         return repr(self.vector)
 
@@ -124,8 +168,8 @@ class Vector(SageVector):
 
         """
         coefficients = {}
-        x = self.parent().base_ring()(self.vector.x())
-        y = self.parent().base_ring()(self.vector.y())
+        x = self._R(self.vector.x())
+        y = self._R(self.vector.y())
         if x:
             coefficients[0] = x
         if y:
@@ -143,8 +187,8 @@ class Vector(SageVector):
             [13, 37]
 
         """
-        yield self.parent().base_ring()(self.vector.x())
-        yield self.parent().base_ring()(self.vector.y())
+        yield self._R(self.vector.x())
+        yield self._R(self.vector.y())
 
     def _add_(self, other):
         r"""
@@ -154,9 +198,16 @@ class Vector(SageVector):
             sage: V = Vectors(QQ)
             sage: V((1,1)) + V((2,-1))
             (3, 0)
+
+        The result is an element of the parent's element class, even if this
+        vector has been created from the plain ``Vector`` class::
+
+            sage: from pyflatsurf.vector import Vector
+            sage: v = Vector(V, (1, 1))
+            sage: type(v + v) is V.element_class
+            True
         """
-        P = self.parent()
-        return P.element_class(P, self.vector + other.vector)
+        return self._P.element_class._wrap(self._P, self._R, self.vector + other.vector)
 
     def _sub_(self, other):
         r"""
@@ -167,8 +218,7 @@ class Vector(SageVector):
             sage: V((1,1)) - V((2,-1))
             (-1, 2)
         """
-        P = self.parent()
-        return P.element_class(P, self.vector - other.vector)
+        return self._P.element_class._wrap(self._P, self._R, self.vector - other.vector)
 
     def _neg_(self):
         r"""
@@ -179,8 +229,7 @@ class Vector(SageVector):
             sage: -V((1,-2))
             (-1, 2)
         """
-        P = self.parent()
-        return P.element_class(P, -self.vector)
+        return self._P.element_class._wrap(self._P, self._R, -self.vector)
 
     def _rmul_(self, scalar):
         r"""
@@ -191,6 +240,10 @@ class Vector(SageVector):
             sage: V = Vectors(ZZ)
             sage: 3 * V((1,2))
             (3, 6)
+            sage: V((1,2))._rmul_(int(3))
+            (3, 6)
+            sage: V((1,2))._rmul_(int(2**100))
+            (1267650600228229401496703205376, 2535301200456458802993406410752)
 
             sage: V = Vectors(QQ)
             sage: V((2, 5)) / 7
@@ -224,12 +277,42 @@ class Vector(SageVector):
             sage: v / R.gen()
             ((1/2*a ~ 0.70710678), (-3/4*a+1 ~ -0.060660172))
         """
-        scalar = self.parent()._to_coordinate(scalar)
+        if self._R is ZZ and (type(scalar) is int or type(scalar) is Integer):
+            scalar = self._mpz_from_int(int(scalar))
+            return self._P.element_class._wrap(self._P, self._R, scalar * self.vector)
+
+        scalar = self._P._to_coordinate(scalar)
 
-        return self.parent()(scalar * self.vector.x(), scalar * self.vector.y())
+        return self._P(scalar * self.vector.x(), scalar * self.vector.y())
 
     _lmul_ = _rmul_
 
+    @staticmethod
+    def _mpz_from_int(n):
+        r"""
+        Return the integer ``n`` as an ``mpz_class``.
+
+        Integers that fit into a machine word are handed to the ``mpz_class``
+        constructor directly, only larger ones go through their string
+        representation.
+
+        TESTS::
+
+            sage: from pyflatsurf.vector import Vector
+            sage: ZZ(Vector._mpz_from_int(int(-3)))
+            -3
+            sage: ZZ(Vector._mpz_from_int(int(2**62 + 1)))
+            4611686018427387905
+            sage: ZZ(Vector._mpz_from_int(int(-2**63)))
+            -9223372036854775808
+            sage: ZZ(Vector._mpz_from_int(int(2**100)))
+            1267650600228229401496703205376
+
+        """
+        if -2**63 <= n < 2**63:
+            return cppyy.gbl.mpz_class(n)
+        return cppyy.gbl.mpz_class(str(n))
+
     def _acted_upon_(self, c, self_on_left):
         r"""
         Act upon this vector with ``c``.
@@ -256,10 +339,10 @@ class Vector(SageVector):
             True
 
         """
-        isomorphic_base_ring = self.parent()._isomorphic_vector_space.base_ring()
-        if isomorphic_base_ring is not self.base_ring():
+        isomorphic_base_ring = self._P._isomorphic_vector_space.base_ring()
+        if isomorphic_base_ring is not self._R:
             if c in isomorphic_base_ring:
-                return self.base_ring()(c) * self
+                return self._R(c) * self
 
         return None
 
@@ -342,6 +425,8 @@ class Vectors(UniqueRepresentation, Parent):
 
         Parent.__init__(self, base_ring, category=FreeModules(base_ring))
 
+        self._to_coordinate = self._coordinate_conversion()
+
         self.register_coercion(self._isomorphic_vector_space)
         self._isomorphic_vector_space.register_conversion(ConversionVectorSpace(self))
 
@@ -427,28 +512,37 @@ class Vectors(UniqueRepresentation, Parent):
         if base is None:
             base = self._algebraic_ring()
 
-        if base is self.base_ring():
-            return [(self.base_ring().one(), tuple(map(base, vector)))]
+        R = self.base_ring()
 
-        if hasattr(self.base_ring(), "number_field") and self.base_ring().number_field is base:
-            return [(self.base_ring().one(), tuple(base(self.base_ring()(x)) for x in vector))]
+        if base is R:
+            return [(R.one(), tuple(map(base, vector)))]
 
-        if isinstance(self.base_ring(), ExactReals):
+        if hasattr(R, "number_field") and R.number_field is base:
+            return [(R.one(), tuple(base(R(x)) for x in vector))]
+
+        if isinstance(R, ExactReals):
            from functools import reduce
            span = type(vector[0].module()).span
            module = reduce(lambda x,y: span(x, y.module()), vector, vector[0].module())
 
            vector = [entry.promote(module).coefficients() for entry in vector]
-           vector = [[base(Vectors(base).base_ring()(c)) for c in coefficients] for coefficients in vector]
+           coefficient_ring = Vectors(base).base_ring()
+           vector = [[base(coefficient_ring(c)) for c in coefficients] for coefficients in vector]
 
            V = base**len(vector)
-           return [(self.base_ring()(module.gen(i)), tuple(V(coefficients))) for (i, coefficients) in enumerate(zip(*vector)) if any(coefficients)]
+           gen = module.gen
+           return [(R(gen(i)), tuple(V(coefficients))) for (i, coefficients) in enumerate(zip(*vector)) if any(coefficients)]
 
         raise NotImplementedError("cannot decompose vector in %s over %s"%(self, base))
 
-    def _to_coordinate(self, x):
+    def _coordinate_conversion(self):
         r"""
-        Convert ``x`` to something that the flatsurf backend for this vector type understands.
+        Return a function that converts its argument to something that the
+        flatsurf backend for this vector type understands.
+
+        The tests for the base ring are performed once here so that the
+        returned function, which is installed as ``_to_coordinate``, does not
+        have to repeat them for every coordinate.
 
         EXAMPLES::
 
@@ -460,22 +554,33 @@ class Vectors(UniqueRepresentation, Parent):
             <class cppyy.gbl.__gmp_expr<__mpq_struct[1],__mpq_struct[1]> at ...>
 
         """
-        if isinstance(x, self.coordinate):
-            return x
-        if isinstance(x, cppyy.gbl.mpz_class):
-            return x
-        if isinstance(x, cppyy.gbl.mpq_class):
-            return x
-        if isinstance(self.base_ring(), real_embedded_number_field.RealEmbeddedNumberField):
-            return self.base_ring()(x).renf_elem
-        if isinstance(self.base_ring(), ExactReals):
-            return self.base_ring()(x)._backend
-        if x in ZZ:
-            return cppyy.gbl.mpz_class(str(x))
-        if x in QQ:
-            return cppyy.gbl.mpq_class(str(x))
-
-        raise NotImplementedError("Cannot convert %s to something the flatsurf backend understands yet, i.e., cannot convert a %s into a %s"%(x, type(x), type(self.coordinate)))
+        coordinate = self.coordinate
+        base_ring = self.base_ring()
+        mpz_class = cppyy.gbl.mpz_class
+        mpq_class = cppyy.gbl.mpq_class
+
+        if isinstance(base_ring, real_embedded_number_field.RealEmbeddedNumberField):
+            def to_coordinate(x):
+                if isinstance(x, (coordinate, mpz_class, mpq_class)):
+                    return x
+                return base_ring(x).renf_elem
+        elif isinstance(base_ring, ExactReals):
+            def to_coordinate(x):
+                if isinstance(x, (coordinate, mpz_class, mpq_class)):
+                    return x
+                return base_ring(x)._backend
+        else:
+            def to_coordinate(x):
+                if isinstance(x, (coordinate, mpz_class, mpq_class)):
+                    return x
+                if x in ZZ:
+                    return mpz_class(str(x))
+                if x in QQ:
+                    return mpq_class(str(x))
+
+                raise NotImplementedError("Cannot convert %s to something the flatsurf backend understands yet, i.e., cannot convert a %s into a %s"%(x, type(x), type(coordinate)))
+
+        return to_coordinate
 
     def _repr_(self):
         r"""
@@ -22,7 +22,6 @@
 
 import sys
 import pytest
-import ctypes
 
 from pyflatsurf import flatsurf
 import surfaces